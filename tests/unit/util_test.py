@@ -0,0 +1,16 @@
+from solara.util import _flatten_style
+
+
+def test_flatten_style():
+    assert _flatten_style(None) == ""
+    assert _flatten_style("color: red") == "color: red"
+    assert _flatten_style({"b": "1px", "a": "red"}) == "b:1px;a:red"
+    assert _flatten_style({"a": "red", "b": "1px"}) == "a:red;b:1px"
+
+
+def test_flatten_style_equal_hash_values():
+    assert _flatten_style({"opacity": 1}) == "opacity:1"
+    assert _flatten_style({"opacity": 1.0}) == "opacity:1.0"
+    assert _flatten_style({"opacity": True}) == "opacity:True"
+    assert _flatten_style({"opacity": 1}) == "opacity:1"
+